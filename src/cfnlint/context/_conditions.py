@@ -8,8 +8,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from cfnlint.helpers import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Condition:
     instance: Any = field(init=True)
     status: bool | None = field(init=True, default=None)
@@ -27,7 +29,7 @@ class Condition:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Conditions:
     # Template level condition management
     conditions: dict[str, Condition] = field(init=True, default_factory=dict)
@@ -5,15 +5,20 @@ SPDX-License-Identifier: MIT-0
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import ChainMap
 from dataclasses import InitVar, dataclass, field, fields
-from typing import Any, Deque, Iterator, Sequence, Set, Tuple
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, Sequence, Set, Tuple
 
 from cfnlint.context._conditions import Conditions
 from cfnlint.context._mappings import Mappings
 from cfnlint.helpers import (
     BOOLEAN_STRINGS_TRUE,
+    DATACLASS_SLOTS,
     FUNCTIONS,
     PSEUDOPARAMS,
     REGION_PRIMARY,
@@ -24,7 +29,7 @@ from cfnlint.schema import PROVIDER_SCHEMA_MANAGER, AttributeDict
 _PSEUDOPARAMS_NON_REGION = ["AWS::AccountId", "AWS::NoValue", "AWS::StackName"]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Transforms:
     # Template level parameters
     transforms: InitVar[str | list[str] | None]
@@ -36,10 +41,9 @@ class Transforms:
         if not isinstance(transforms, list):
             transforms = [transforms]
 
-        for transform in transforms:
-            if not isinstance(transform, str):
-                continue
-            self._transforms.append(transform)
+        self._transforms = [
+            transform for transform in transforms if isinstance(transform, str)
+        ]
 
     def has_language_extensions_transform(self):
         lang_extensions_transform = "AWS::LanguageExtensions"
@@ -49,7 +53,7 @@ class Transforms:
         return bool(TRANSFORM_SAM in self._transforms)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Path:
     """
     A `Path` keeps track of the different Path values
@@ -57,19 +61,28 @@ class Path:
 
     # path keeps track of the path as we move down the template
     # Example: Resources, MyResource, Properties, Name, ...
-    path: Deque[str | int] = field(init=True, default_factory=deque)
+    path: Tuple[str | int, ...] = field(init=True, default=())
 
     # value_path is an override of the value if we got it from another place
     # like a Parameter default value
     # Example: Parameters, MyParameter, Default, ...
-    value_path: Deque[str | int] = field(init=True, default_factory=deque)
+    value_path: Tuple[str | int, ...] = field(init=True, default=())
 
     # cfn_path is a generic path used by cfn-lint to help make
     # writing rules easier.  The resource name is replaced by the type
     # lists are replaced with a *
     # Example: Resources, AWS::S3::Bucket, Properties, Name, ...
     # Example: Resources, *, Type
-    cfn_path: Deque[str] = field(init=True, default_factory=deque)
+    cfn_path: Tuple[str, ...] = field(init=True, default=())
+
+    def __post_init__(self) -> None:
+        # paths are immutable tuples so descending shares the parent
+        # segments instead of copying them.  Callers historically
+        # passed deques so normalize any iterable into a tuple
+        for name in _PATH_FIELD_NAMES:
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
 
     def descend(self, **kwargs) -> "Path":
         """
@@ -82,11 +95,19 @@ class Path:
         elif isinstance(kwargs.get("cfn_path"), int):
             raise ValueError(f"{kwargs['cfn_path']!r} cannot be an integer")
 
-        for f in fields(Path):
-            if kwargs.get(f.name) is not None:
-                kwargs[f.name] = getattr(self, f.name) + deque([kwargs[f.name]])
+        for name in _PATH_FIELD_NAMES:
+            value = kwargs.get(name)
+            if value is not None:
+                # segments come from a small vocabulary of section,
+                # resource, and property names so intern them to share
+                # the strings and speed up later comparisons.  str
+                # subclasses (like the decoder's str_node) can't be
+                # interned so check the exact type
+                if type(value) is str:  # noqa: E721
+                    value = sys.intern(value)
+                kwargs[name] = getattr(self, name) + (value,)
             else:
-                kwargs[f.name] = getattr(self, f.name)
+                kwargs[name] = getattr(self, name)
 
         return cls(**kwargs)
 
@@ -96,8 +117,8 @@ class Path:
         """
         cls = self.__class__
 
-        for f in fields(Path):
-            kwargs.setdefault(f.name, getattr(self, f.name))
+        for name in _PATH_FIELD_NAMES:
+            kwargs.setdefault(name, getattr(self, name))
 
         return cls(**kwargs)
 
@@ -110,7 +131,15 @@ class Path:
         return "/".join(self.cfn_path)
 
 
-@dataclass(frozen=True)
+# `__post_init__`, `descend` and `evolve` run for every step down the
+# template so resolve the field names once instead of on every call
+_PATH_FIELD_NAMES = tuple(f.name for f in fields(Path))
+
+# Path is immutable so every empty path can be the same instance
+_EMPTY_PATH = Path()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Context:
     """
     A `Context` keeps track of the current context that we are evaluating against
@@ -133,7 +162,7 @@ class Context:
     # supported functions at this point in the template
     functions: Sequence[str] = field(init=True, default_factory=list)
 
-    path: Path = field(init=True, default_factory=Path)
+    path: Path = field(init=True, default=_EMPTY_PATH)
 
     # cfn-lint Template class
     parameters: dict[str, "Parameter"] = field(init=True, default_factory=dict)
@@ -149,7 +178,7 @@ class Context:
 
     # Combiniation of storing any resolved ref
     # and adds in any Refs available from things like Fn::Sub
-    ref_values: dict[str, Any] = field(init=True, default_factory=dict)
+    ref_values: Mapping[str, Any] = field(init=True, default_factory=dict)
 
     transforms: Transforms = field(init=True, default_factory=lambda: Transforms([]))
 
@@ -160,13 +189,19 @@ class Context:
         cls = self.__class__
 
         if "ref_values" in kwargs:
-            new_ref_values = self.ref_values.copy()
-            new_ref_values.update(kwargs["ref_values"])
-            kwargs["ref_values"] = new_ref_values
+            # chain the delta on top of the parent mapping so we
+            # don't copy the parent refs for every scope we enter.
+            # only the first map is ever written to so the parent
+            # can stay a read-only Mapping
+            if kwargs["ref_values"]:
+                kwargs["ref_values"] = ChainMap(
+                    kwargs["ref_values"], self.ref_values  # type: ignore[arg-type]
+                )
+            else:
+                kwargs["ref_values"] = self.ref_values
 
-        for f in fields(Context):
-            if f.init:
-                kwargs.setdefault(f.name, getattr(self, f.name))
+        for name in _CONTEXT_INIT_FIELDS:
+            kwargs.setdefault(name, getattr(self, name))
 
         return cls(**kwargs)
 
@@ -191,9 +226,7 @@ class Context:
                 # need to evaluate if Fn::If would be not true if value is
                 # what it is
                 yield v, self.evolve(
-                    path=self.path.evolve(
-                        value_path=deque(["Parameters", instance]) + path
-                    ),
+                    path=self.path.evolve(value_path=("Parameters", instance) + path),
                     ref_values={instance: v},
                 )
             return
@@ -203,47 +236,66 @@ class Context:
             for region in self.regions:
                 # We can resolve all region based pseudo values
                 # as we are now deciding on a region.
-                yield _get_pseudo_value_by_region(instance, region), self.evolve(
+                pseudo_values = _pseudo_values_by_region(region)
+                yield pseudo_values[instance], self.evolve(
                     regions=[region],
-                    ref_values={
-                        p: _get_pseudo_value_by_region(p, region)
-                        for p in PSEUDOPARAMS
-                        if p not in _PSEUDOPARAMS_NON_REGION
-                    },
+                    ref_values=pseudo_values,
                 )
 
     @property
     def refs(self):
-        pseudo_params = list(self.pseudo_parameters)
-        pseudo_params.sort()
-        return (
-            list(self.parameters.keys())
-            + list(self.resources.keys())
-            + pseudo_params
-            + list(self.ref_values.keys())
+        return list(
+            chain(
+                self.parameters,
+                self.resources,
+                sorted(self.pseudo_parameters),
+                self.ref_values,
+            )
         )
 
 
+# `evolve` is called for every step down the template so we
+# resolve the init fields once instead of on every call
+_CONTEXT_INIT_FIELDS = tuple(f.name for f in fields(Context) if f.init)
+
+
+@lru_cache(maxsize=None)
+def _pseudo_values_by_region(region: str) -> Mapping[str, str | list[str]]:
+    # the values only depend on the region so build the mapping once
+    # per region and share the frozen result between contexts
+    return MappingProxyType(
+        {
+            p: _get_pseudo_value_by_region(p, region)
+            for p in PSEUDOPARAMS
+            if p not in _PSEUDOPARAMS_NON_REGION
+        }
+    )
+
+
 def _get_pseudo_value(parameter: str) -> str | list[str] | None:
-    if parameter == "AWS::AccountId":
-        return "123456789012"
-    if parameter == "AWS::StackName":
-        return "teststack"
-    return None
+    return _PSEUDO_VALUES.get(parameter)
 
 
 def _get_pseudo_value_by_region(parameter: str, region: str) -> str | list[str]:
-    if parameter == "AWS::NotificationARNs":
-        return [f"arn:{_get_partition(region)}:sns:{region}:123456789012:notification"]
-    if parameter == "AWS::Partition":
-        return _get_partition(region)
-    if parameter == "AWS::Region":
-        return region
-    if parameter == "AWS::StackId":
-        return (
-            f"arn:{_get_partition(region)}:cloudformation:{region}"
-            ":123456789012:stack/teststack/51af3dc0-da77-11e4-872e-1234567db123"
-        )
+    return _PSEUDO_VALUE_BY_REGION.get(parameter, _get_url_suffix)(region)
+
+
+def _get_notification_arns(region: str) -> list[str]:
+    return [f"arn:{_get_partition(region)}:sns:{region}:123456789012:notification"]
+
+
+def _get_region(region: str) -> str:
+    return region
+
+
+def _get_stack_id(region: str) -> str:
+    return (
+        f"arn:{_get_partition(region)}:cloudformation:{region}"
+        ":123456789012:stack/teststack/51af3dc0-da77-11e4-872e-1234567db123"
+    )
+
+
+def _get_url_suffix(region: str) -> str:
     if region in ("cn-north-1", "cn-northwest-1"):
         return "amazonaws.com.cn"
     else:
@@ -259,6 +311,20 @@ def _get_partition(region) -> str:
         return "aws"
 
 
+_PSEUDO_VALUES = {
+    "AWS::AccountId": "123456789012",
+    "AWS::StackName": "teststack",
+}
+
+_PSEUDO_VALUE_BY_REGION: dict[str, Callable[[str], str | list[str]]] = {
+    "AWS::NotificationARNs": _get_notification_arns,
+    "AWS::Partition": _get_partition,
+    "AWS::Region": _get_region,
+    "AWS::StackId": _get_stack_id,
+    "AWS::URLSuffix": _get_url_suffix,
+}
+
+
 class _Ref(ABC):
     """
     Abstract class for all ref types
@@ -269,7 +335,7 @@ class _Ref(ABC):
         pass
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Parameter(_Ref):
     """
     This class holds a parameter and its attributes
@@ -279,6 +345,9 @@ class Parameter(_Ref):
     default: Any = field(init=False)
     allowed_values: Any = field(init=False)
     description: str | None = field(init=False)
+    min_value: Any = field(init=False, default=None)
+    max_value: Any = field(init=False, default=None)
+    no_echo: bool = field(init=False, default=False)
 
     parameter: InitVar[Any]
 
@@ -324,30 +393,30 @@ class Parameter(_Ref):
         if parameter.get("NoEcho") in list(BOOLEAN_STRINGS_TRUE) + [True]:
             self.no_echo = True
 
-    def ref(self, context: Context) -> Iterator[Tuple[Any, deque]]:
+    def ref(self, context: Context) -> Iterator[Tuple[Any, Tuple[str | int, ...]]]:
         if self.allowed_values:
             for i, allowed_value in enumerate(self.allowed_values):
                 if isinstance(allowed_value, list):
-                    yield [str(x) for x in allowed_value], deque(["AllowedValues", i])
+                    yield [str(x) for x in allowed_value], ("AllowedValues", i)
                 else:
-                    yield str(allowed_value), deque(["AllowedValues", i])
+                    yield str(allowed_value), ("AllowedValues", i)
             # assume default is an allowed value so we skip it
             return
 
         if self.default is not None:
             if isinstance(self.default, list):
-                yield [str(x) for x in self.default], deque(["Default"])
+                yield [str(x) for x in self.default], ("Default",)
             else:
-                yield str(self.default), deque(["Default"])
+                yield str(self.default), ("Default",)
 
         if self.min_value is not None:
-            yield str(self.min_value), deque(["MinValue"])
+            yield str(self.min_value), ("MinValue",)
 
         if self.max_value is not None:
-            yield str(self.max_value), deque(["MaxValue"])
+            yield str(self.max_value), ("MaxValue",)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Resource(_Ref):
     """
     This class holds a resources and its type
@@ -436,6 +505,6 @@ def create_context_for_template(cfn):
         transforms=transforms,
         mappings=mappings,
         regions=cfn.regions,
-        path=Path(),
+        path=_EMPTY_PATH,
         functions=["Fn::Transform"],
     )
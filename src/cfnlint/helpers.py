@@ -26,6 +26,13 @@ import regex as re
 
 LOGGER = logging.getLogger(__name__)
 
+# keyword arguments to give frequently created dataclasses
+# __slots__ layouts where the runtime supports it (Python 3.10+)
+if sys.version_info >= (3, 10):
+    DATACLASS_SLOTS: dict[str, bool] = {"slots": True}
+else:
+    DATACLASS_SLOTS = {}
+
 AVAILABILITY_ZONES = {
     "af-south-1": ["af-south-1a", "af-south-1b", "af-south-1c"],
     "ap-east-1": ["ap-east-1a", "ap-east-1b", "ap-east-1c"],
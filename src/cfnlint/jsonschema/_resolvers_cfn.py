@@ -47,9 +47,7 @@ def find_in_map(validator: Validator, instance: Any) -> ResolutionResult:
                 for value, v, _ in validator.resolve_value(options["DefaultValue"]):
                     yield value, v.evolve(
                         context=v.context.evolve(
-                            path=v.context.path.evolve(
-                                value_path=deque([4, "DefaultValue"])
-                            )
+                            path=v.context.path.evolve(value_path=(4, "DefaultValue"))
                         ),
                     ), None
                 default_value_found = True
@@ -313,7 +311,7 @@ def if_(validator: Validator, instance: Any) -> ResolutionResult:
                 value,
                 v.evolve(
                     context=v.context.evolve(
-                        path=v.context.path.evolve(value_path=deque([i])),
+                        path=v.context.path.evolve(value_path=(i,)),
                     ),
                 ),
                 err,
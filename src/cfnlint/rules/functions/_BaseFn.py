@@ -5,10 +5,12 @@ SPDX-License-Identifier: MIT-0
 
 from __future__ import annotations
 
+import weakref
 from collections import namedtuple
+from functools import lru_cache
 from typing import Any, Tuple
 
-from cfnlint.helpers import ToPy, ensure_list, is_types_compatible
+from cfnlint.helpers import ToPy, _translate_types, ensure_list
 from cfnlint.jsonschema import ValidationError, ValidationResult, Validator
 from cfnlint.rules import CloudFormationLintRule
 
@@ -17,6 +19,13 @@ all_types = ("array", "boolean", "integer", "number", "object", "string")
 singular_types = ("boolean", "integer", "number", "string")
 
 
+@lru_cache(maxsize=None)
+def _resolver_has_resolve(cls: type) -> bool:
+    # which resolver API is available only depends on the resolver
+    # type so probe it once per class instead of per ref resolution
+    return hasattr(cls, "resolve")
+
+
 class BaseFn(CloudFormationLintRule):
     def __init__(
         self,
@@ -28,14 +37,19 @@ class BaseFn(CloudFormationLintRule):
         self.fn = ToPy(name)
         self.types = types or tuple([])
         self.functions = functions or tuple([])
+        # the types a rule can return are fixed so translate them to
+        # their compatible set once instead of on every validation
+        self._compatible_types = frozenset(_translate_types(list(self.types)))
+        self._validator_cache: Tuple[weakref.ref, Validator] | None = None
 
     def key_value(self, instance: dict[str, Any]) -> Tuple[str, Any]:
-        return list(instance.keys())[0], instance.get(self.fn.name)
+        return next(iter(instance)), instance.get(self.fn.name)
 
     def fix_errors(self, errs: ValidationResult) -> ValidationResult:
+        py = self.fn.py
         for err in errs:
-            if err.validator not in ["ref"]:  # fix the list to all validators
-                err.validator = self.fn.py
+            if err.validator != "ref":  # fix the list to all validators
+                err.validator = py
             yield err
 
     def schema(self, validator: Validator, instance: Any) -> dict[str, Any]:
@@ -44,7 +58,14 @@ class BaseFn(CloudFormationLintRule):
         }
 
     def validator(self, validator: Validator) -> Validator:
-        return validator.evolve(
+        # the evolution only depends on the rule's functions so when a
+        # rule validates many sibling nodes under the same validator we
+        # can hand back the previous evolution instead of rebuilding it
+        cached = self._validator_cache
+        if cached is not None and cached[0]() is validator:
+            return cached[1]
+
+        evolved = validator.evolve(
             context=validator.context.evolve(
                 functions=self.functions,
             ),
@@ -52,6 +73,11 @@ class BaseFn(CloudFormationLintRule):
                 add_cfn_lint_keyword=False,
             ),
         )
+        try:
+            self._validator_cache = (weakref.ref(validator), evolved)
+        except TypeError:
+            self._validator_cache = None
+        return evolved
 
     def resolve(
         self,
@@ -93,12 +119,11 @@ class BaseFn(CloudFormationLintRule):
 
     def _resolve_ref(self, validator, schema) -> Any:
 
-        resolve = getattr(validator.resolver, "resolve", None)
         ref = schema["$ref"]
-        if resolve is None:
-            resolved = validator.resolver.resolving(ref)
-        else:
+        if _resolver_has_resolve(type(validator.resolver)):  # type: ignore[arg-type]
             _, resolved = validator.resolver.resolve(ref)
+        else:
+            resolved = validator.resolver.resolving(ref)
 
         return resolved
 
@@ -118,7 +143,7 @@ class BaseFn(CloudFormationLintRule):
     ) -> ValidationResult:
         tS = self.resolve_type(validator, s)
         if tS:
-            if not is_types_compatible(self.types, tS):
+            if self._compatible_types.isdisjoint(tS):
                 reprs = ", ".join(repr(type) for type in tS)
                 yield ValidationError(f"{instance!r} is not of type {reprs}")
 
@@ -136,13 +161,11 @@ class BaseFn(CloudFormationLintRule):
 
         key, value = self.key_value(instance)
         errs.extend(
-            list(
-                self.fix_errors(
-                    self.validator(validator).descend(
-                        value,
-                        self.schema(validator, instance),
-                        path=key,
-                    )
+            self.fix_errors(
+                self.validator(validator).descend(
+                    value,
+                    self.schema(validator, instance),
+                    path=key,
                 )
             )
         )
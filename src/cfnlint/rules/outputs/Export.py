@@ -31,7 +31,7 @@ class Export(CfnLintJsonSchema):
         validator = validator.evolve(
             context=validator.context.evolve(
                 resources={},
-                functions=list(FUNCTIONS),
+                functions=FUNCTIONS,
             ),
             schema={"type": "string"},
         )
@@ -38,7 +38,7 @@ class Value(CfnLintJsonSchema):
             conditions = {condition: True}
         validator = validator.evolve(
             context=validator.context.evolve(
-                functions=list(FUNCTIONS),
+                functions=FUNCTIONS,
                 conditions=validator.context.conditions.evolve(
                     conditions,
                 ),
@@ -37,7 +37,7 @@ class CfnInit(CfnLintJsonSchema):
         cfn_validator = self.extend_validator(
             validator=validator,
             schema=self._schema,
-            context=validator.context.evolve(functions=list(FUNCTIONS)),
+            context=validator.context.evolve(functions=FUNCTIONS),
         )
 
         yield from super()._iter_errors(cfn_validator, instance)
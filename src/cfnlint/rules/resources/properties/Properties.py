@@ -4,7 +4,6 @@ SPDX-License-Identifier: MIT-0
 """
 
 import logging
-from collections import deque
 from typing import Any
 
 from cfnlint.helpers import FUNCTIONS
@@ -69,7 +68,7 @@ class Properties(CfnLintJsonSchema):
 
         validator = validator.evolve(
             context=validator.context.evolve(
-                functions=list(FUNCTIONS),
+                functions=FUNCTIONS,
                 strict_types=False,
                 conditions=validator.context.conditions.evolve(
                     resolved_conditions,
@@ -92,7 +91,7 @@ class Properties(CfnLintJsonSchema):
                 context=validator.context.evolve(
                     regions=regions,
                     path=validator.context.path.evolve(
-                        cfn_path=deque(["Resources", t, "Properties"]),
+                        cfn_path=("Resources", t, "Properties"),
                     ).descend(path="Properties"),
                 ),
             )
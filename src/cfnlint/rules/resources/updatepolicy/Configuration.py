@@ -35,7 +35,7 @@ class Configuration(CfnLintJsonSchema):
     def validate(self, validator: Validator, keywords: Any, instance: Any, schema: Any):
         validator = validator.evolve(
             context=validator.context.evolve(
-                functions=list(FUNCTIONS),
+                functions=FUNCTIONS,
                 strict_types=False,
             ),
             schema=self._schema,
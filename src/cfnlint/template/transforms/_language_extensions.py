@@ -9,13 +9,12 @@ import hashlib
 import json
 import logging
 import random
+import re
 import string
 import sys
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any, Iterator, Mapping, MutableMapping, Tuple
 
-import regex as re
-
 from cfnlint.conditions._utils import get_hash
 from cfnlint.decode.node import str_node
 from cfnlint.helpers import FUNCTION_FOR_EACH
@@ -28,6 +27,11 @@ _N = 7
 
 _SCALAR_TYPES = (str, int, float, bool)
 
+# compiled once as we match placeholders for every key and
+# value while flattening a Fn::ForEach
+_REPLACEMENT_PATTERN = re.compile(r"(\$|&)\{([a-zA-Z0-9\.:]+)\}")
+_NOT_ALPHANUMERIC_PATTERN = re.compile("[^0-9a-zA-Z]+")
+
 
 class _ResolveError(Exception):
     def __init__(self, message: str, key: Any) -> None:
@@ -108,19 +112,32 @@ class _Transform:
 
     # pylint: disable=too-many-return-statements
     def _walk(self, item: Any, params: MutableMapping[str, Any], cfn: Any):
-        obj = deepcopy(item)
+        if not isinstance(item, (dict, list)):
+            return item
+
+        # a shallow copy of the level we mutate is enough; children are
+        # either rebuilt by the recursive walks below or shared with the
+        # source template, which is replaced by the transformed result.
+        # Deep copying here made expansion cost a full copy of the
+        # remaining subtree at every nesting level.  copy.copy keeps
+        # the decoder node classes and their source marks where
+        # dict.copy/list.copy would return plain builtins
+        obj = copy(item)
         if isinstance(obj, dict):
-            # adjust keys if needed
+            # adjust keys if needed; obj is still an unmodified copy
+            # of item here so snapshot its items while we mutate it
             if params:
-                for k, v in item.items():
+                for k, v in list(obj.items()):
                     _, new_k = self._replace_string_params(k, params)
                     if new_k != k:
                         del obj[k]
                         obj[new_k] = v
 
-            for k, v in deepcopy(obj).items():
+            # snapshot the items so we can delete and add keys while
+            # we iterate
+            for k, v in list(obj.items()):
                 # see if key matches Fn::ForEach
-                if re.match(FUNCTION_FOR_EACH, k):
+                if FUNCTION_FOR_EACH.match(k):
                     # only translate the foreach if its valid
                     foreach = _ForEach(k, v, self._collections)
                     # get the values will flatten the foreach
@@ -146,14 +163,17 @@ class _Transform:
                         if only_string:
                             return obj[k]
                     if isinstance(v, list):
-                        only_string, obj[k][0] = self._replace_string_params(
+                        # copy before editing as the list is shared
+                        # with the source template
+                        v = obj[k] = copy(v)
+                        only_string, v[0] = self._replace_string_params(
                             v[0],
                             params,
                         )
                         if only_string:
-                            return obj[k][0]
+                            return v[0]
                         if len(v) == 2:
-                            obj[k][1] = self._walk(v[1], params, cfn)
+                            v[1] = self._walk(v[1], params, cfn)
                 elif k == "Fn::FindInMap":
                     try:
                         mapping = _ForEachValueFnFindInMap(get_hash(v), v)
@@ -165,9 +185,9 @@ class _Transform:
                         # We couldn't resolve the FindInMap so we are going to
                         # leave it as it is
                         LOGGER.debug("Transform and Fn::FindInMap error: %s", {str(e)})
+                    v = obj[k] = copy(v)
                     for i, el in enumerate(v):
                         v[i] = self._walk(el, params, cfn)
-                    obj[k] = v
                 elif k == "Ref":
                     if isinstance(v, str):
                         if v in params:
@@ -198,12 +218,14 @@ class _Transform:
         s: str,
         params: Mapping[str, Any],
     ) -> Tuple[bool, str]:
-        pattern = r"(\$|&){[a-zA-Z0-9\.:]+}"
-        if not re.search(pattern, s):
+        if not _REPLACEMENT_PATTERN.search(s):
             return (True, s)
 
-        new_s = deepcopy(s)
-        for k, v in params.items():
+        def _replace(match):
+            k = match.group(2)
+            if k not in params:
+                return match.group(0)
+            v = params[k]
             if isinstance(v, dict):
                 if sys.version_info.major == 3 and sys.version_info.minor > 8:
                     v = (
@@ -215,13 +237,16 @@ class _Transform:
                     )
                 else:
                     v = hashlib.md5(json.dumps(v).encode("utf-8")).digest().hex()[0:4]
-            new_s = re.sub(rf"\$\{{{k}\}}", v, new_s)
-            new_s = re.sub(rf"\&\{{{k}\}}", re.sub("[^0-9a-zA-Z]+", "", v), new_s)
+            if match.group(1) == "&":
+                return _NOT_ALPHANUMERIC_PATTERN.sub("", v)
+            return v
+
+        new_s = _REPLACEMENT_PATTERN.sub(_replace, s)
 
         if isinstance(s, str_node):
             new_s = str_node(new_s, s.start_mark, s.end_mark)
 
-        return (not (bool(re.search(pattern, new_s))), new_s)
+        return (not (bool(_REPLACEMENT_PATTERN.search(new_s))), new_s)
 
 
 class _ForEachValue:
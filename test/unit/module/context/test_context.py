@@ -47,7 +47,7 @@ class TestCfnContext(unittest.TestCase):
                 "Foo": False,
             },
         )
-        self.assertEqual(evolved.path.path, deque([1]))
+        self.assertEqual(evolved.path.path, (1,))
 
         evolved_again = evolved.evolve(
             path=evolved.path.descend(path=2),
@@ -59,7 +59,7 @@ class TestCfnContext(unittest.TestCase):
         self.assertDictEqual(
             evolved_again.conditions.status, {"Foo": False, "Bar": True}
         )
-        self.assertEqual(evolved_again.path.path, deque([1, 2]))
+        self.assertEqual(evolved_again.path.path, (1, 2))
         # no changes to the original
         self.assertListEqual(context.regions, ["us-east-1"])
         self.assertEqual(
@@ -71,7 +71,7 @@ class TestCfnContext(unittest.TestCase):
                 }
             ),
         )
-        self.assertEqual(context.path.path, deque())
+        self.assertEqual(context.path.path, ())
 
         no_path = context.evolve(regions=["us-east-2"])
         self.assertListEqual(no_path.regions, ["us-east-2"])
@@ -84,7 +84,7 @@ class TestCfnContext(unittest.TestCase):
                 }
             ),
         )
-        self.assertEqual(no_path.path.path, deque())
+        self.assertEqual(no_path.path.path, ())
 
         with self.assertRaises(ValueError):
             evolved_again.evolve(
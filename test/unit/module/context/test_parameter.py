@@ -3,8 +3,6 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 SPDX-License-Identifier: MIT-0
 """
 
-from collections import deque
-
 import pytest
 
 from cfnlint.context import Context
@@ -27,8 +25,8 @@ from cfnlint.context.context import Parameter, _init_parameters
             },
             "String",
             [
-                ("foo", deque(["AllowedValues", 0])),
-                ("bar", deque(["AllowedValues", 1])),
+                ("foo", ("AllowedValues", 0)),
+                ("bar", ("AllowedValues", 1)),
             ],
         ),
         (
@@ -39,7 +37,7 @@ from cfnlint.context.context import Parameter, _init_parameters
             },
             "CommaDelimitedList",
             [
-                (["foo"], deque(["Default"])),
+                (["foo"], ("Default",)),
             ],
         ),
         (
@@ -49,7 +47,7 @@ from cfnlint.context.context import Parameter, _init_parameters
                 "Default": "10,20",
             },
             "List<Number>",
-            [(["10", "20"], deque(["Default"]))],
+            [(["10", "20"], ("Default",))],
         ),
         (
             "Valid parameter with a List of numbers for allowed values",
@@ -58,7 +56,7 @@ from cfnlint.context.context import Parameter, _init_parameters
                 "AllowedValues": ["10,20"],
             },
             "List<Number>",
-            [(["10", "20"], deque(["AllowedValues", 0]))],
+            [(["10", "20"], ("AllowedValues", 0))],
         ),
         (
             "Valid parameter with a SSM Parameter",
@@ -73,19 +71,19 @@ from cfnlint.context.context import Parameter, _init_parameters
             "Valid parameter with a MinValue and MaxValue",
             {"Type": "Number", "MinValue": "10", "MaxValue": "20"},
             "Number",
-            [("10", deque(["MinValue"])), ("20", deque(["MaxValue"]))],
+            [("10", ("MinValue",)), ("20", ("MaxValue",))],
         ),
         (
             "Valid list parameter with an integer value",
             {"Type": "List<Number>", "Default": 10},
             "List<Number>",
-            [(["10"], deque(["Default"]))],
+            [(["10"], ("Default",))],
         ),
         (
             "Valid list parameter with an integer value",
             {"Type": "List<Number>", "AllowedValues": [10]},
             "List<Number>",
-            [(["10"], deque(["AllowedValues", 0]))],
+            [(["10"], ("AllowedValues", 0))],
         ),
     ],
 )
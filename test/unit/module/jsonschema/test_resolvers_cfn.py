@@ -197,7 +197,7 @@ def test_invalid_functions(name, instance, response):
         (
             "Valid Join with a list of strings",
             {"Fn::Join": [".", ["a", "b", "c"]]},
-            [("a.b.c", deque([]), None)],
+            [("a.b.c", (), None)],
         ),
         (
             "Valid GetAZs with empty string",
@@ -212,7 +212,7 @@ def test_invalid_functions(name, instance, response):
                         "us-east-1e",
                         "us-east-1f",
                     ],
-                    deque([]),
+                    (),
                     None,
                 )
             ],
@@ -220,14 +220,14 @@ def test_invalid_functions(name, instance, response):
         (
             "Valid FindInMap with a default value",
             {"Fn::FindInMap": ["foo", "bar", "value", {"DefaultValue": "default"}]},
-            [("default", deque([4, "DefaultValue"]), None)],
+            [("default", (4, "DefaultValue"), None)],
         ),
         (
             "Valid FindInMap with a default value",
             {"Fn::FindInMap": ["foo", "first", "second", {"DefaultValue": "default"}]},
             [
-                ("default", deque([4, "DefaultValue"]), None),
-                ("bar", deque([2]), None),
+                ("default", (4, "DefaultValue"), None),
+                ("bar", (2,), None),
             ],
         ),
         (
@@ -236,7 +236,7 @@ def test_invalid_functions(name, instance, response):
             [
                 (
                     None,
-                    deque([]),
+                    (),
                     ValidationError(
                         (
                             "'bar' is not one of ['foo', "
@@ -250,7 +250,7 @@ def test_invalid_functions(name, instance, response):
         (
             "Valid FindInMap with a bad mapping and default",
             {"Fn::FindInMap": ["bar", "first", "second", {"DefaultValue": "default"}]},
-            [("default", deque([4, "DefaultValue"]), None)],
+            [("default", (4, "DefaultValue"), None)],
         ),
         (
             "Valid FindInMap with a bad mapping and aws no value",
@@ -270,7 +270,7 @@ def test_invalid_functions(name, instance, response):
             [
                 (
                     None,
-                    deque([]),
+                    (),
                     ValidationError(
                         ("'second' is not one of ['first'] for " "mapping 'foo'"),
                         path=deque(["Fn::FindInMap", 1]),
@@ -281,7 +281,7 @@ def test_invalid_functions(name, instance, response):
         (
             "Valid FindInMap with a bad top key and default",
             {"Fn::FindInMap": ["foo", "second", "first", {"DefaultValue": "default"}]},
-            [("default", deque([4, "DefaultValue"]), None)],
+            [("default", (4, "DefaultValue"), None)],
         ),
         (
             "Valid FindInMap with a bad third key",
@@ -289,7 +289,7 @@ def test_invalid_functions(name, instance, response):
             [
                 (
                     None,
-                    deque([]),
+                    (),
                     ValidationError(
                         (
                             "'third' is not one of ['second'] for "
@@ -303,7 +303,7 @@ def test_invalid_functions(name, instance, response):
         (
             "Valid FindInMap with a bad second key and default",
             {"Fn::FindInMap": ["foo", "first", "third", {"DefaultValue": "default"}]},
-            [("default", deque([4, "DefaultValue"]), None)],
+            [("default", (4, "DefaultValue"), None)],
         ),
         (
             "Valid FindInMap with a transform on first key",
@@ -318,12 +318,12 @@ def test_invalid_functions(name, instance, response):
         (
             "Valid Sub with a resolvable values",
             {"Fn::Sub": ["${a}-${b}", {"a": "foo", "b": "bar"}]},
-            [("foo-bar", deque([]), None)],
+            [("foo-bar", (), None)],
         ),
         (
             "Valid Sub with empty parameters",
             {"Fn::Sub": ["foo", {}]},
-            [("foo", deque([]), None)],
+            [("foo", (), None)],
         ),
     ],
 )
@@ -349,7 +349,7 @@ def test_valid_functions(name, instance, response):
             [
                 (
                     None,
-                    deque([]),
+                    (),
                     ValidationError(
                         ("{'Ref': 'MyParameter'} is not one of []"),
                         path=deque(["Fn::FindInMap", 0]),
@@ -360,7 +360,7 @@ def test_valid_functions(name, instance, response):
         (
             "Invalid FindInMap with no mappings and default value",
             {"Fn::FindInMap": ["A", "B", "C", {"DefaultValue": "default"}]},
-            [("default", deque([4, "DefaultValue"]), None)],
+            [("default", (4, "DefaultValue"), None)],
         ),
     ],
 )
@@ -6,6 +6,7 @@ SPDX-License-Identifier: MIT-0
 from copy import deepcopy
 from unittest import TestCase
 
+from cfnlint.api import lint
 from cfnlint.decode import convert_dict
 from cfnlint.template import Template
 from cfnlint.template.transforms._language_extensions import (
@@ -663,6 +664,20 @@ class TestTransform(TestCase):
         )
 
 
+class TestTransformKeepsSourceMarks(TestCase):
+    def test_match_line_numbers(self):
+        # the transform walk must keep the decoder's source marks so
+        # matches point at the right lines in the original template
+        filename = "test/fixtures/templates/good/functions_findinmap_enhanced.yaml"
+        with open(filename) as f:
+            matches = lint(f.read())
+
+        self.assertListEqual(
+            [match.linenumber for match in matches if match.rule.id == "E1011"],
+            [83, 88, 94],
+        )
+
+
 def nested_set(dic, keys, value):
     for key in keys[:-1]:
         if isinstance(key, str):
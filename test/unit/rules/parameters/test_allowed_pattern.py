@@ -67,5 +67,5 @@ class TestAllowedPattern(BaseRuleTestCase):
             self.assertEqual(err.message, "'1' does not match '^[A-Z]$'")
             self.assertEqual(err.rule, self.rule)
             self.assertEqual(
-                err.path_override, deque(["Parameters", "MyParameter", "Default"])
+                err.path_override, ("Parameters", "MyParameter", "Default")
             )
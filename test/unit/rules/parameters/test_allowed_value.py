@@ -38,5 +38,5 @@ class TestAllowedValue(BaseRuleTestCase):
             self.assertEqual(err.message, "['A', 'B'] is not one of '1'")
             self.assertEqual(err.rule, self.rule)
             self.assertEqual(
-                err.path_override, deque(["Parameters", "MyParameter", "Default"])
+                err.path_override, ("Parameters", "MyParameter", "Default")
             )
@@ -86,9 +86,7 @@ def test_validate(name, instance, expected, rule, validator):
 
 def test_validate_with_no_path(rule, validator):
     validator = validator.evolve(
-        context=validator.context.path.evolve(
-            path=Path(path=deque([]), cfn_path=deque([]))
-        )
+        context=validator.context.evolve(path=Path(path=(), cfn_path=()))
     )
 
     errors = list(rule.validate(validator, False, {}, {}))